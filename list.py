@@ -22,160 +22,263 @@ Examples:
     python list.py all --sort   # List all models sorted by price
 """
 
+import functools
 import json
+import os
+import pickle
 import sys
+import tempfile
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+DATA_PATH = Path(__file__).parent / "prices" / "data.json"
+# Parsed data.json, pickled together with its cache key: (CACHE_VERSION, mtime_ns, size)
+CACHE_PATH = DATA_PATH.with_suffix(".pkl")
+# Bump when the shape of the cached data changes
+CACHE_VERSION = 1
+
+
+def _cache_key():
+    stat = DATA_PATH.stat()
+    return CACHE_VERSION, stat.st_mtime_ns, stat.st_size
+
+
+def _read_cache(cache_key):
+    """Return the cached data if it matches ``cache_key``, otherwise None."""
+    try:
+        with open(CACHE_PATH, "rb") as f:
+            key, data = pickle.load(f)
+    except Exception:
+        # A missing or corrupt cache just means data.json is parsed again
+        return None
+    return data if key == cache_key else None
+
+
+def _add_price_ranges(data):
+    """Store the min and max of input + output price on each provider.
+
+    They are kept as ``_min_price`` and ``_max_price`` (0.0 if no model has a price),
+    so they are computed once when the cache is built rather than on every run.
+    """
+    for provider in data:
+        # Calculate min and max prices (sum of input + output)
+        prices = []
+        for model in provider.get("models", []):
+            prices_raw = model.get("prices", {})
+            if not isinstance(prices_raw, dict):
+                continue  # Skip models with list prices
+            # Skip tiered or otherwise non-numeric values
+            try:
+                input_val = float(prices_raw.get("input_mtok") or 0)
+                output_val = float(prices_raw.get("output_mtok") or 0)
+            except (TypeError, ValueError):
+                continue
+            if input_val > 0 or output_val > 0:
+                prices.append(input_val + output_val)
+        
+        provider["_min_price"] = min(prices, default=0.0)
+        provider["_max_price"] = max(prices, default=0.0)
+
+
+def _parse_and_cache(cache_key):
+    with open(DATA_PATH, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        data = orjson.loads(raw)
+    else:
+        data = json.loads(raw)
+    _add_price_ranges(data)
+
+    # Write to a temporary file and swap it in, so concurrent runs never see a partial cache
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_PATH.parent, prefix=CACHE_PATH.name, suffix=".tmp")
+    except OSError:
+        return data
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((cache_key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+    return data
+
+
+@functools.lru_cache(maxsize=1)
 def load_data():
-    """Load the prices data from data.json."""
-    data_path = Path(__file__).parent / "prices" / "data.json"
-    with open(data_path) as f:
-        return json.load(f)
+    """Load the prices data from data.json, using orjson when it is installed.
+
+    The parsed data is cached in a pickle next to data.json, keyed by the file's
+    mtime and size, so repeated runs skip JSON parsing until data.json changes.
+    """
+    cache_key = _cache_key()
+    data = _read_cache(cache_key)
+    if data is None:
+        data = _parse_and_cache(cache_key)
+    return data
+
 
+def build_index(providers):
+    """Precompute case-folded provider and model ids/names for filter matching.
 
-def matches_filter(text:str, filter_str:str):
-    """Check if text matches the filter (case-insensitive)."""
-    return filter_str.lower() in text.lower()
+    Yields ``(provider_id_cf, provider_name_cf, provider, models)`` tuples, where
+    ``models`` is a list of ``(model_id_cf, model_name_cf, model)`` tuples.
+    """
+    for provider in providers:
+        models = [
+            (model.get("id", "").casefold(), model.get("name", "").casefold(), model)
+            for model in provider.get("models", [])
+        ]
+        yield provider.get("id", "").casefold(), provider.get("name", "").casefold(), provider, models
+
+
+_format_dollars = "${:.2f}".format
 
 
 def format_price(price_value):
-    """Format a price value, return empty string if None or invalid."""
+    """Format a price value, returning the display string and its numeric value.
+
+    Returns ``("", 0.0)`` if the price is None or invalid.
+    """
     if price_value is None:
-        return ""
+        return "", 0.0
     try:
-        return f"${float(price_value):.2f}"
+        value = float(price_value)
     except (TypeError, ValueError):
-        return ""
+        return "", 0.0
+    return _format_dollars(value), value
 
 
-def list_prices(filter_str: str, sort_by_price: bool = False):
-    """List prices for all providers and models, optionally filtered and sorted."""
-    data = load_data()
-    
+class Rows:
+    """Table rows stored column-wise, with one list per column."""
+
+    __slots__ = ("provider", "name", "input", "write", "read", "out", "model", "price_sum")
+
+    def __init__(self):
+        for column in self.__slots__:
+            setattr(self, column, [])
+
+    def __len__(self):
+        return len(self.name)
+
+
+RULE = "=" * 120
+
+# Stands in for dict.get on models without a flat prices dict
+_no_prices_get = {}.get
+
+# (header, Rows attribute, alignment) for each displayed column
+TABLE_COLUMNS = (
+    ("Provider", "provider", "<"),
+    ("Name", "name", "<"),
+    ("Input", "input", ">"),
+    ("Write", "write", ">"),
+    ("Read", "read", ">"),
+    ("Out", "out", ">"),
+    ("Model", "model", "<"),
+)
+
+
+def list_prices(filter_str: str, sort_by_price: bool = False, data=None):
+    """List prices for all providers and models, optionally filtered and sorted.
+
+    ``data`` is the already loaded prices data, if the caller has it.
+    """
     # If "all" is passed, treat as empty filter (list everything)
-    if filter_str.lower() == "all":
-        filter_str = ""
+    filter_cf = filter_str.casefold()
+    if filter_cf == "all":
+        filter_str = filter_cf = ""
+    
+    providers = data if data is not None else load_data()
     
     matched_any = False
-    current_provider = None
-    table_rows: list[dict[str, str | float]] = []
-    all_rows: list[dict[str, str | float]] = []  # For sorting across providers
+    all_rows = Rows()  # For sorting across providers
     
-    for provider in data:
+    # Bind the names called for every listed model to locals
+    _isinstance = isinstance
+    _format_price = format_price
+    
+    for provider_id_cf, provider_name_cf, provider, models in build_index(providers):
         provider_id = provider.get("id", "")
         provider_name = provider.get("name", "")
         
         # Check if provider matches filter
         provider_matches = (
-            filter_str == ""
-            or ( matches_filter(provider_id, filter_str))
-            or ( matches_filter(provider_name, filter_str))
+            filter_cf == ""
+            or filter_cf in provider_id_cf
+            or filter_cf in provider_name_cf
         )
         
-        if not provider_matches:
-            # Check if any models match the filter
-            models = provider.get("models", [])
-            has_matching_models = any(
-                matches_filter(model.get("id", ""), filter_str)
-                or matches_filter(model.get("name", ""), filter_str)
-                for model in models
-            )
-            if not has_matching_models:
+        # Keep every model if the provider matched, otherwise only matching models
+        if provider_matches:
+            matching = [model for _, _, model in models]
+        else:
+            matching = [
+                model
+                for model_id_cf, model_name_cf, model in models
+                if filter_cf in model_id_cf or filter_cf in model_name_cf
+            ]
+            if not matching:
                 continue
         
-        # List models
-        models = provider.get("models", [])
-        for model in models:
-            model_id = model.get("id", "")
-            model_name = model.get("name", "")
-            
-            # Check if model matches filter (but skip this check if provider already matched)
-            if not provider_matches and filter_str != "":
-                model_matches = (
-                    matches_filter(model_id, filter_str)
-                    or matches_filter(model_name, filter_str)
-                )
-                if not model_matches:
-                    continue
-            
+        # Sorted output collects every provider's rows into one table
+        rows = all_rows if sort_by_price else Rows()
+        if matching:
             matched_any = True
-            prices_raw = model.get("prices", {})
+        
+        # Bind this table's column appends to locals, the model loop runs for every listed model
+        add_provider = rows.provider.append
+        add_name = rows.name.append
+        add_input = rows.input.append
+        add_write = rows.write.append
+        add_read = rows.read.append
+        add_out = rows.out.append
+        add_model = rows.model.append
+        add_price_sum = rows.price_sum.append
+        
+        # List models
+        for model in matching:
+            model_get = model.get
+            model_id = model_get("id", "")
+            model_name = model_get("name", "")
+            prices_raw = model_get("prices", {})
             
-            # Handle prices that might be a dict or a list
-            if isinstance(prices_raw, list):
-                prices = {}  # Skip models with list prices
-            elif isinstance(prices_raw, dict):
-                prices = prices_raw
-            else:
-                prices = {}
+            # Handle prices that might be a dict or a list (skip models with list prices)
+            prices_get = prices_raw.get if _isinstance(prices_raw, dict) else _no_prices_get
             
             # Collect price columns
-            input_price = format_price(prices.get("input_mtok"))
-            write_price = format_price(prices.get("cache_write_mtok"))
-            read_price = format_price(prices.get("cache_read_mtok"))
-            out_price = format_price(prices.get("output_mtok"))
-            
-            # Calculate sum of input and output for sorting
-            input_val = 0.0
-            output_val = 0.0
-            try:
-                input_raw = prices.get("input_mtok", 0)
-                output_raw = prices.get("output_mtok", 0)
-                input_val = float(input_raw) if input_raw and isinstance(input_raw, (int, float, str)) else 0.0
-                output_val = float(output_raw) if output_raw and isinstance(output_raw, (int, float, str)) else 0.0
-            except (TypeError, ValueError):
-                pass
-            price_sum = input_val + output_val
+            input_price, input_val = _format_price(prices_get("input_mtok"))
+            write_price, _ = _format_price(prices_get("cache_write_mtok"))
+            read_price, _ = _format_price(prices_get("cache_read_mtok"))
+            out_price, output_val = _format_price(prices_get("output_mtok"))
             
             # Add row to table
-            display_name = model_name if model_name else model_id
-            row = {
-                "Name": display_name,
-                "Input": input_price,
-                "Write": write_price,
-                "Read": read_price,
-                "Out": out_price,
-                "Model": model_id,
-                "PriceSum": price_sum,  # For sorting
-            }
-            all_rows.append(row)
-            
-            if not sort_by_price:
-                # Print provider header if changed
-                if current_provider != provider_name:
-                    if table_rows:
-                        # Print previous table
-                        print_table(table_rows)
-                        table_rows = []
-                    current_provider = provider_name
-                    print(f"\n{'='*120}")
-                    print(f"Provider: {provider_name} ({provider_id})")
-                    print(f"{'='*120}")
-                table_rows.append(row)
+            add_provider(provider_name)
+            add_name(model_name if model_name else model_id)
+            add_input(input_price)
+            add_write(write_price)
+            add_read(read_price)
+            add_out(out_price)
+            add_model(model_id)
+            add_price_sum(input_val + output_val)  # For sorting
+        
+        if not sort_by_price and len(rows):
+            sys.stdout.write(f"\n{RULE}\nProvider: {provider_name} ({provider_id})\n{RULE}\n")
+            print_table(rows)
     
     if sort_by_price:
         # Sort all rows by price sum (lowest first)
-        all_rows.sort(key=lambda x: x["PriceSum"])  # type: ignore
-        
-        # Add provider name to each row for sorted output
-        for row in all_rows:
-            # Find the provider name from the original data
-            for provider in data:
-                for model in provider.get("models", []):
-                    if model.get("id") == row.get("Model"):
-                        row["Provider"] = provider.get("name", "")
-                        break
+        order = sorted(range(len(all_rows)), key=all_rows.price_sum.__getitem__)
         
         # Print all sorted rows with a single header
-        print(f"\n{'='*120}")
-        print("All Models Sorted by Price (Input + Output)")
-        print(f"{'='*120}")
-        print_table(all_rows)
-    else:
-        # Print remaining table
-        if table_rows:
-            print_table(table_rows)
+        sys.stdout.write(f"\n{RULE}\nAll Models Sorted by Price (Input + Output)\n{RULE}\n")
+        print_table(all_rows, order, show_provider=True)
     
     if filter_str and not matched_any:
         print(f"\nNo providers or models matching '{filter_str}' found.")
@@ -184,42 +287,39 @@ def list_prices(filter_str: str, sort_by_price: bool = False):
     return 0
 
 
-def print_table(rows):
-    """Print a formatted table of model prices."""
-    if not rows:
+def print_table(rows: Rows, order=None, show_provider: bool = False):
+    """Print a formatted table of model prices, in ``order`` if given."""
+    if not len(rows):
         return
+    if order is None:
+        order = range(len(rows))
     
     # Determine which columns to display
-    has_provider = any("Provider" in row for row in rows)
-    columns = ["Provider", "Name", "Input", "Write", "Read", "Out", "Model"] if has_provider else ["Name", "Input", "Write", "Read", "Out", "Model"]
+    columns = TABLE_COLUMNS if show_provider else TABLE_COLUMNS[1:]
+    column_values = [getattr(rows, attr) for _, attr, _ in columns]
     
     # Calculate column widths
-    col_widths = {}
-    for col in columns:
-        col_widths[col] = max(
-            len(col),
-            max(len(str(row.get(col, ""))) for row in rows) if rows else len(col)
-        )
+    widths = [
+        max(len(header), max(map(len, values)))
+        for (header, _, _), values in zip(columns, column_values)
+    ]
     
-    # Print header
-    header = " | ".join(
-        f"{col:<{col_widths[col]}}" if col in ["Name", "Model", "Provider"]
-        else f"{col:>{col_widths[col]}}"
-        for col in columns
+    # Build the row template once rather than re-parsing a format spec per cell
+    template = " | ".join(
+        f"{{:{align}{width}}}" for (_, _, align), width in zip(columns, widths)
     )
-    separator = "-+-".join("-" * col_widths[col] for col in columns)
+    format_row = template.format
+    separator = "-+-".join("-" * width for width in widths)
     
-    print(header)
-    print(separator)
+    lines = [format_row(*(header for header, _, _ in columns)), separator]
+    lines.extend(
+        format_row(*cells)
+        for cells in zip(*(map(values.__getitem__, order) for values in column_values))
+    )
+    lines.append("")
     
-    # Print rows
-    for row in rows:  # type: ignore
-        line = " | ".join(
-            f"{str(row.get(col, '')):<{col_widths[col]}}" if col in ["Name", "Model", "Provider"]
-            else f"{str(row.get(col, '')):>{col_widths[col]}}"
-            for col in columns
-        )
-        print(line)
+    # Write the whole table at once rather than calling print() per row
+    sys.stdout.write("\n".join(lines))
 
 
 def main():
@@ -227,6 +327,7 @@ def main():
     
     filter_str = ""
     sort_by_price = False
+    data = None
     
     if len(sys.argv) > 1:
         # Parse arguments
@@ -244,27 +345,9 @@ def main():
         for provider in data:
             provider_id = provider.get("id", "")
             provider_name = provider.get("name", "")
-            models = provider.get("models", [])
-            model_count = len(models)
-            
-            # Calculate min and max prices (sum of input + output)
-            prices = []
-            for model in models:
-                prices_raw = model.get("prices", {})
-                if isinstance(prices_raw, dict):
-                    input_val = prices_raw.get("input_mtok", 0)
-                    output_val = prices_raw.get("output_mtok", 0)
-                    # Convert to float safely
-                    try:
-                        input_val = float(input_val) if input_val else 0.0
-                        output_val = float(output_val) if output_val else 0.0
-                        if input_val > 0 or output_val > 0:
-                            prices.append(input_val + output_val)
-                    except (TypeError, ValueError):
-                        pass
-            
-            min_price = min(prices) if prices else 0.0
-            max_price = max(prices) if prices else 0.0
+            model_count = len(provider.get("models", []))
+            min_price = provider["_min_price"]
+            max_price = provider["_max_price"]
             
             providers.append((provider_name, provider_id, model_count, min_price, max_price))
         
@@ -296,7 +379,7 @@ def main():
             print("No filter provided. Exiting.")
             return 0
     
-    return list_prices(filter_str, sort_by_price)
+    return list_prices(filter_str, sort_by_price, data)
 
 
 if __name__ == "__main__":